@@ -16,6 +16,8 @@ class Settings:
         "GOOGLE_SERVICE_ACCOUNT_FILE",
         str(Path.home() / ".config" / "gcloud" / "service-account.json")
     )
+    # Seconds a fetched copy of the sheet is reused before re-reading it
+    SHEETS_CACHE_TTL: float = float(os.getenv("SHEETS_CACHE_TTL", "5"))
 
     # App configuration
     STAGE_NAME: str = os.getenv("STAGE_NAME", "Main Stage")
@@ -11,15 +11,21 @@ To use:
 4. Set GOOGLE_SHEETS_ID and GOOGLE_SERVICE_ACCOUNT_FILE in .env
 """
 
+import asyncio
+import threading
 from datetime import time
-from typing import Optional
-
-import gspread
-from google.oauth2.service_account import Credentials
+from functools import lru_cache
+from time import monotonic
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 from app.config import settings
 from app.models import Act
 
+# gspread and google-auth are slow to import, so they are only loaded by
+# _get_sheet on first use
+if TYPE_CHECKING:
+    import gspread
+
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
 ]
@@ -31,39 +37,272 @@ COL_SCHEDULED_END = 5    # E - "scheduled end"
 COL_ACTUAL_START = 6     # F - "actual time on"
 COL_ACTUAL_END = 7       # G - "actual time off"
 
+# Cell indices within a DATA_RANGE row (0-based, starting at column B)
+IDX_ARTIST_NAME = COL_ARTIST_NAME - COL_ARTIST_NAME
+IDX_SCHEDULED_START = COL_SCHEDULED_START - COL_ARTIST_NAME
+IDX_SCHEDULED_END = COL_SCHEDULED_END - COL_ARTIST_NAME
+IDX_ACTUAL_START = COL_ACTUAL_START - COL_ARTIST_NAME
+IDX_ACTUAL_END = COL_ACTUAL_END - COL_ARTIST_NAME
+
 HEADER_ROW = 5  # Header is on row 5, data starts row 6
 
-_client: Optional[gspread.Client] = None
-_sheet: Optional[gspread.Worksheet] = None
+# Only artist name (B) through actual time off (G) is read, from the first data row down
+DATA_RANGE = "B6:G"
+
+_client: Optional["gspread.Client"] = None
+_sheet: Optional["gspread.Worksheet"] = None
+_init_lock = threading.Lock()
+
+# (fetched_at, data_rows, name_index) from the last DATA_RANGE read, reused for
+# SHEETS_CACHE_TTL seconds. name_index maps act name -> position of its first row.
+_cache: Optional[tuple[float, list[list[str]], dict[str, int]]] = None
+_cache_lock = threading.Lock()
+
+# Incremented whenever the schedule changes (local writes or edits seen on a
+# re-read) so broadcasts can skip an unchanged schedule
+_version: int = 0
 
+# Background writes: while write_loop() runs, mutators queue (row_num, col, value)
+# cells here instead of calling the API, and write_loop flushes them in batches.
+# _pending_writes holds queued values not yet confirmed written, keyed by
+# (row_num, col), so a cache re-read does not revert them. A failed batch is
+# retried WRITE_MAX_ATTEMPTS times, backing off WRITE_RETRY_SECONDS * attempt.
+WRITE_BATCH_SECONDS = 0.1
+WRITE_MAX_ATTEMPTS = 5
+WRITE_RETRY_SECONDS = 1.0
+_write_queue: Optional[asyncio.Queue] = None
+_pending_writes: dict[tuple[int, int], str] = {}
 
-def _get_sheet() -> gspread.Worksheet:
+
+def _get_sheet() -> "gspread.Worksheet":
     """Get or create the Google Sheets client and worksheet."""
     global _client, _sheet
 
+    # Checked again under the lock so concurrent first calls (request handlers
+    # and the writer thread) authenticate and open the spreadsheet only once
     if _sheet is None:
-        creds = Credentials.from_service_account_file(
-            settings.GOOGLE_SERVICE_ACCOUNT_FILE,
-            scopes=SCOPES,
-        )
-        _client = gspread.authorize(creds)
-        spreadsheet = _client.open_by_key(settings.GOOGLE_SHEETS_ID)
-        if settings.GOOGLE_SHEET_TAB:
-            _sheet = spreadsheet.worksheet(settings.GOOGLE_SHEET_TAB)
-        else:
-            _sheet = spreadsheet.sheet1
+        with _init_lock:
+            if _sheet is None:
+                import gspread
+                from google.auth.transport.requests import AuthorizedSession
+                from google.oauth2.service_account import Credentials
+                from requests.adapters import HTTPAdapter
+
+                creds = Credentials.from_service_account_file(
+                    settings.GOOGLE_SERVICE_ACCOUNT_FILE,
+                    scopes=SCOPES,
+                )
+                # One pooled keep-alive session so every Sheets call reuses the same
+                # TLS connection instead of paying the handshake again
+                session = AuthorizedSession(creds)
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=2))
+                _client = gspread.Client(auth=creds, session=session)
+                spreadsheet = _client.open_by_key(settings.GOOGLE_SHEETS_ID)
+                if settings.GOOGLE_SHEET_TAB:
+                    _sheet = spreadsheet.worksheet(settings.GOOGLE_SHEET_TAB)
+                else:
+                    _sheet = spreadsheet.sheet1
 
     return _sheet
 
 
+def _get_data_rows_cached() -> tuple[list[list[str]], dict[str, int]]:
+    """Get the DATA_RANGE rows and their name index, re-reading from Google only
+    once the cache has expired.
+
+    Rows start at sheet row HEADER_ROW + 1 and cells start at column B; trailing
+    empty rows and cells are omitted by the API, so rows may be ragged.
+    """
+    global _cache, _version
+
+    with _cache_lock:
+        if _cache is not None and monotonic() - _cache[0] < settings.SHEETS_CACHE_TTL:
+            return _cache[1], _cache[2]
+
+    data_rows = _get_sheet().get(DATA_RANGE)
+    for (row_num, col), value in list(_pending_writes.items()):
+        _set_cell(data_rows, row_num, col, value)
+    name_index: dict[str, int] = {}
+    for i, row in enumerate(data_rows):
+        act_name = _get_cell(row, COL_ARTIST_NAME)
+        if act_name:
+            name_index.setdefault(act_name, i)
+
+    with _cache_lock:
+        if _cache is None or _cache[1] != data_rows:
+            _version += 1
+        _cache = (monotonic(), data_rows, name_index)
+
+    return data_rows, name_index
+
+
+def _set_cell(rows: list[list[str]], row_num: int, col: int, value: str) -> None:
+    """Write a value into DATA_RANGE rows in place (row_num and col are 1-indexed sheet positions)."""
+    row_idx = row_num - HEADER_ROW - 1
+    if row_idx >= len(rows):
+        return
+    row = rows[row_idx]
+    idx = col - COL_ARTIST_NAME
+    if idx >= len(row):
+        row.extend([""] * (idx + 1 - len(row)))
+    row[idx] = value
+    # Drop trailing blanks like the API does, so a re-read compares equal
+    while row and row[-1] == "":
+        row.pop()
+
+
+def _patch_cache(row_num: int, col: int, value: str) -> None:
+    """Write a value into the cached copy of the sheet (row and col are 1-indexed)."""
+    global _version
+
+    with _cache_lock:
+        _version += 1
+        if _cache is not None:
+            _set_cell(_cache[1], row_num, col, value)
+
+
+def _invalidate_cache() -> None:
+    """Drop the cached copy so the next read comes from the sheet."""
+    global _cache
+
+    with _cache_lock:
+        _cache = None
+
+
+def _col_letter(col: int) -> str:
+    """Convert a 1-indexed column number to its A1 letter (only A-Z is needed here)."""
+    return chr(ord("A") + col - 1)
+
+
+def _batch_update(cells: dict[tuple[int, int], str]) -> None:
+    """Write cells keyed by (row_num, col) in a single batch_update call (1-indexed).
+
+    Contiguous columns in a row are sent as one range, e.g. F6 and G6 become F6:G6.
+    Values are sent USER_ENTERED (as update_cell does) so "14:30" is stored as
+    a time rather than text.
+    """
+    sheet = _get_sheet()
+    from gspread.utils import ValueInputOption
+
+    ranges = []
+    for row_num, col in sorted(cells):
+        value = cells[(row_num, col)]
+        if ranges and ranges[-1]["row"] == row_num and ranges[-1]["end"] == col - 1:
+            ranges[-1]["end"] = col
+            ranges[-1]["values"].append(value)
+        else:
+            ranges.append({"row": row_num, "start": col, "end": col, "values": [value]})
+
+    sheet.batch_update(
+        [
+            {
+                "range": f"{_col_letter(r['start'])}{r['row']}:{_col_letter(r['end'])}{r['row']}",
+                "values": [r["values"]],
+            }
+            for r in ranges
+        ],
+        value_input_option=ValueInputOption.user_entered,
+    )
+
+
+def _write_row_cells(row_num: int, updates: dict[int, str]) -> None:
+    """Write several cells of one row (cols are 1-indexed) and patch the cache.
+
+    While write_loop() is running the cells are queued for it and this returns
+    without waiting on the API; otherwise they are written immediately.
+    """
+    if _write_queue is not None:
+        for col, value in updates.items():
+            _pending_writes[(row_num, col)] = value
+            _write_queue.put_nowait((row_num, col, value))
+    else:
+        _batch_update({(row_num, col): value for col, value in updates.items()})
+
+    for col, value in updates.items():
+        _patch_cache(row_num, col, value)
+
+
+async def write_loop(on_write_failed: Optional[Callable[[], Awaitable[None]]] = None) -> None:
+    """Flush queued writes to the sheet until cancelled.
+
+    Run as a background task. Writes arriving within WRITE_BATCH_SECONDS of each
+    other are coalesced (last value per cell wins) into one batch_update call.
+    A failed batch stays pending and is retried with backoff; if it still fails
+    after WRITE_MAX_ATTEMPTS, its cells are dropped, the cache is re-read from the
+    sheet and on_write_failed is awaited so clients can be sent the reverted
+    schedule. Anything still pending when the task is cancelled is written
+    before it exits.
+    """
+    global _write_queue, _version
+
+    loop = asyncio.get_running_loop()
+    _write_queue = asyncio.Queue()
+    try:
+        while True:
+            row_num, col, value = await _write_queue.get()
+            cells = {(row_num, col): value}
+            deadline = loop.time() + WRITE_BATCH_SECONDS
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    row_num, col, value = await asyncio.wait_for(_write_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                cells[(row_num, col)] = value
+
+            written = False
+            for attempt in range(1, WRITE_MAX_ATTEMPTS + 1):
+                try:
+                    await asyncio.to_thread(_batch_update, cells)
+                    written = True
+                    break
+                except Exception as e:
+                    print(f"Error writing to Google Sheets (attempt {attempt}/{WRITE_MAX_ATTEMPTS}): {e}")
+                if attempt < WRITE_MAX_ATTEMPTS:
+                    await asyncio.sleep(WRITE_RETRY_SECONDS * attempt)
+                    # Retry with the latest value of each cell, in case it was
+                    # overwritten while waiting
+                    cells = {key: _pending_writes.get(key, value) for key, value in cells.items()}
+
+            for key, value in cells.items():
+                if _pending_writes.get(key) == value:
+                    del _pending_writes[key]
+
+            if not written:
+                # Give up: re-read the sheet so clients see what was actually stored
+                _invalidate_cache()
+                with _cache_lock:
+                    _version += 1
+                if on_write_failed is not None:
+                    try:
+                        await on_write_failed()
+                    except Exception as e:
+                        print(f"Error handling failed Google Sheets write: {e}")
+    finally:
+        _write_queue = None
+        if _pending_writes:
+            try:
+                _batch_update(dict(_pending_writes))
+            except Exception as e:
+                print(f"Error writing to Google Sheets: {e}")
+            _pending_writes.clear()
+
+
+# Sheet cells repeat the same few time strings on every read; time objects are
+# immutable, so parsed results can be shared
+@lru_cache(maxsize=2048)
 def _parse_time(time_str: str) -> Optional[time]:
-    """Parse a time string (HH:MM) to a time object."""
-    if not time_str or time_str.strip() == "":
+    """Parse a time string (H:MM, HH:MM or HH:MM:SS, seconds ignored) to a time object."""
+    if not time_str:
         return None
+    s = time_str.strip()
+    # Slice around the colons rather than split() to avoid building a list per cell
+    colon = s.find(":")
+    if colon < 1:
+        return None
+    end = s.find(":", colon + 1)
     try:
-        parts = time_str.strip().split(":")
-        return time(int(parts[0]), int(parts[1]))
-    except (ValueError, IndexError):
+        return time(int(s[:colon]), int(s[colon + 1:] if end == -1 else s[colon + 1:end]))
+    except ValueError:
         return None
 
 
@@ -71,108 +310,124 @@ def _format_time(t: Optional[time]) -> str:
     """Format a time object to HH:MM string."""
     if t is None:
         return ""
-    return t.strftime("%H:%M")
+    return f"{t.hour:02d}:{t.minute:02d}"
 
 
 def _get_cell(row: list, col: int) -> str:
-    """Safely get a cell value from a row (col is 1-indexed)."""
-    idx = col - 1
+    """Safely get a cell value from a DATA_RANGE row (col is 1-indexed, row starts at B)."""
+    idx = col - COL_ARTIST_NAME
     if idx < len(row):
         return str(row[idx])
     return ""
 
 
+def _row_to_act(row: list) -> Optional[Act]:
+    """Build an Act from a DATA_RANGE row, or None if it lacks a name or scheduled times."""
+    act_name = _get_cell(row, COL_ARTIST_NAME)
+    scheduled_start = _parse_time(_get_cell(row, COL_SCHEDULED_START))
+    scheduled_end = _parse_time(_get_cell(row, COL_SCHEDULED_END))
+    # Skip rows without act name or required scheduled times
+    if not act_name or not scheduled_start or not scheduled_end:
+        return None
+    return Act(
+        act_name=act_name,
+        scheduled_start=scheduled_start,
+        scheduled_end=scheduled_end,
+        actual_start=_parse_time(_get_cell(row, COL_ACTUAL_START)),
+        actual_end=_parse_time(_get_cell(row, COL_ACTUAL_END)),
+        notes=None,
+    )
+
+
 def get_schedule() -> list[Act]:
     """Fetch all acts from the Google Sheet."""
-    sheet = _get_sheet()
-    # Get all values starting from the data row (after header)
-    all_values = sheet.get_all_values()
-    data_rows = all_values[HEADER_ROW:]  # Skip header rows (0-indexed, so row 6 = index 5)
+    data_rows, _ = _get_data_rows_cached()
 
-    acts = []
-    for row in data_rows:
-        act_name = _get_cell(row, COL_ARTIST_NAME)
-        scheduled_start = _parse_time(_get_cell(row, COL_SCHEDULED_START))
-        scheduled_end = _parse_time(_get_cell(row, COL_SCHEDULED_END))
-        # Skip rows without act name or required scheduled times
-        if not act_name or not scheduled_start or not scheduled_end:
-            continue
-        act = Act(
-            act_name=act_name,
+    # Same rules as _row_to_act, unrolled into one pass with direct indexing
+    return [
+        Act(
+            act_name=row[IDX_ARTIST_NAME],
             scheduled_start=scheduled_start,
             scheduled_end=scheduled_end,
-            actual_start=_parse_time(_get_cell(row, COL_ACTUAL_START)),
-            actual_end=_parse_time(_get_cell(row, COL_ACTUAL_END)),
+            actual_start=_parse_time(row[IDX_ACTUAL_START]) if len(row) > IDX_ACTUAL_START else None,
+            actual_end=_parse_time(row[IDX_ACTUAL_END]) if len(row) > IDX_ACTUAL_END else None,
             notes=None,
         )
-        acts.append(act)
+        for row in data_rows
+        if len(row) > IDX_SCHEDULED_END
+        and row[IDX_ARTIST_NAME]
+        and (scheduled_start := _parse_time(row[IDX_SCHEDULED_START]))
+        and (scheduled_end := _parse_time(row[IDX_SCHEDULED_END]))
+    ]
 
-    return acts
+
+def get_schedule_version() -> int:
+    """Get the current schedule version (increases whenever the schedule changes)."""
+    return _version
 
 
 def get_act(act_name: str) -> Optional[Act]:
     """Get a single act by name."""
-    acts = get_schedule()
-    for act in acts:
-        if act.act_name == act_name:
-            return act
-    return None
+    found = _find_row(act_name)
+    if found is None:
+        return None
+    return _row_to_act(found[1])
 
 
-def _find_row(act_name: str) -> Optional[int]:
-    """Find the row number for an act (1-indexed, accounting for header on row 5)."""
-    sheet = _get_sheet()
-    all_values = sheet.get_all_values()
-    data_rows = all_values[HEADER_ROW:]  # Skip header rows
+def _find_row(act_name: str) -> Optional[tuple[int, list]]:
+    """Find the sheet row for an act.
 
-    for i, row in enumerate(data_rows):
-        if _get_cell(row, COL_ARTIST_NAME) == act_name:
-            return i + HEADER_ROW + 1  # Convert back to 1-indexed sheet row
+    Returns (row_num, row) where row_num is the 1-indexed sheet row and row is
+    the cached DATA_RANGE row, which _write_row_cells patches in place.
+    """
+    data_rows, name_index = _get_data_rows_cached()
 
-    return None
+    i = name_index.get(act_name)
+    if i is None:
+        return None
+    return i + HEADER_ROW + 1, data_rows[i]  # Convert back to 1-indexed sheet row
 
 
 def update_actual_start(act_name: str, actual_time: time) -> Optional[Act]:
     """Update the actual start time for an act."""
-    sheet = _get_sheet()
-    row_num = _find_row(act_name)
+    found = _find_row(act_name)
 
-    if row_num is None:
+    if found is None:
         return None
+    row_num, row = found
 
     # actual_start column F = column 6
-    sheet.update_cell(row_num, COL_ACTUAL_START, _format_time(actual_time))
+    _write_row_cells(row_num, {COL_ACTUAL_START: _format_time(actual_time)})
 
-    return get_act(act_name)
+    return _row_to_act(row)
 
 
 def update_actual_end(act_name: str, actual_time: time) -> Optional[Act]:
     """Update the actual end time for an act."""
-    sheet = _get_sheet()
-    row_num = _find_row(act_name)
+    found = _find_row(act_name)
 
-    if row_num is None:
+    if found is None:
         return None
+    row_num, row = found
 
     # actual_end column G = column 7
-    sheet.update_cell(row_num, COL_ACTUAL_END, _format_time(actual_time))
+    _write_row_cells(row_num, {COL_ACTUAL_END: _format_time(actual_time)})
 
-    return get_act(act_name)
+    return _row_to_act(row)
 
 
 def clear_actual_times(act_name: str) -> Optional[Act]:
     """Clear both actual start and end times for an act."""
-    sheet = _get_sheet()
-    row_num = _find_row(act_name)
+    found = _find_row(act_name)
 
-    if row_num is None:
+    if found is None:
         return None
+    row_num, row = found
 
     # Clear actual_start (F) and actual_end (G)
-    sheet.update_cell(row_num, COL_ACTUAL_START, "")
-    sheet.update_cell(row_num, COL_ACTUAL_END, "")
+    _write_row_cells(row_num, {COL_ACTUAL_START: "", COL_ACTUAL_END: ""})
 
-    return get_act(act_name)
+    return _row_to_act(row)
 
 
 def get_stage_name() -> str:
@@ -1,12 +1,12 @@
-from datetime import datetime, time, timedelta
+from datetime import datetime, time
 from typing import Optional
 
 from app.models import Act
 
 
-def time_to_datetime(t: time) -> datetime:
-    """Convert a time to a datetime on today's date."""
-    return datetime.combine(datetime.today(), t)
+def time_to_seconds(t: time) -> int:
+    """Convert a time to whole seconds since midnight."""
+    return t.hour * 3600 + t.minute * 60 + t.second
 
 
 def calculate_slip(acts: list[Act], current_time: Optional[time] = None) -> int:
@@ -22,40 +22,40 @@ def calculate_slip(acts: list[Act], current_time: Optional[time] = None) -> int:
     if current_time is None:
         current_time = datetime.now().time()
 
-    slip = 0
-
-    for act in acts:
+    # Only the latest act with a recorded time determines slip, so walk
+    # backwards and stop at the first one found. Arithmetic is on plain
+    # seconds-since-midnight ints, so no datetime/timedelta objects are built.
+    for act in reversed(acts):
         if act.actual_end:
             # Act completed - check if it ran late
-            end_variance = act.end_variance or 0
-            slip = max(0, end_variance)
-        elif act.actual_start and not act.actual_end:
+            end_variance = time_to_seconds(act.actual_end) - time_to_seconds(act.scheduled_end)
+            return max(0, end_variance)
+        elif act.actual_start:
             # Act in progress - project when it will end
-            actual_start_dt = time_to_datetime(act.actual_start)
-            projected_end_dt = actual_start_dt + timedelta(seconds=act.scheduled_duration)
-            scheduled_end_dt = time_to_datetime(act.scheduled_end)
+            scheduled_end = time_to_seconds(act.scheduled_end)
+            scheduled_duration = scheduled_end - time_to_seconds(act.scheduled_start)
+            projected_end = time_to_seconds(act.actual_start) + scheduled_duration
 
             # Slip is how late the projected end is vs scheduled
-            projected_slip = int((projected_end_dt - scheduled_end_dt).total_seconds())
-            slip = max(0, projected_slip)
+            return max(0, projected_end - scheduled_end)
 
-    return slip
+    return 0
 
 
 def format_duration(seconds: int) -> str:
     """Format a duration in seconds to a human-readable string."""
-    if seconds < 0:
-        return f"-{format_duration(abs(seconds))}"
+    sign = "-" if seconds < 0 else ""
+    s = -seconds if seconds < 0 else seconds
 
-    hours, remainder = divmod(seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
+    hours = s // 3600
+    minutes = s // 60 % 60
 
     if hours > 0:
-        return f"{hours}h {minutes}m"
+        return f"{sign}{hours}h {minutes}m"
     elif minutes > 0:
-        return f"{minutes}m"
+        return f"{sign}{minutes}m"
     else:
-        return f"{secs}s"
+        return f"{sign}{s % 60}s"
 
 
 def format_variance(seconds: Optional[int]) -> str:
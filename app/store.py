@@ -49,12 +49,26 @@ _schedule: list[Act] = [
 
 STAGE_NAME = "Main Stage"
 
+# Incremented on every change so broadcasts can skip an unchanged schedule
+_version: int = 0
+
+
+def _bump_version() -> None:
+    """Mark the schedule as changed."""
+    global _version
+    _version += 1
+
 
 def get_schedule() -> list[Act]:
     """Get the current schedule."""
     return _schedule.copy()
 
 
+def get_schedule_version() -> int:
+    """Get the current schedule version (increases whenever the schedule changes)."""
+    return _version
+
+
 def get_act(act_name: str) -> Optional[Act]:
     """Get a single act by name."""
     for act in _schedule:
@@ -68,6 +82,7 @@ def update_actual_start(act_name: str, actual_time: time) -> Optional[Act]:
     for i, act in enumerate(_schedule):
         if act.act_name == act_name:
             _schedule[i] = act.model_copy(update={"actual_start": actual_time})
+            _bump_version()
             return _schedule[i]
     return None
 
@@ -77,6 +92,7 @@ def update_actual_end(act_name: str, actual_time: time) -> Optional[Act]:
     for i, act in enumerate(_schedule):
         if act.act_name == act_name:
             _schedule[i] = act.model_copy(update={"actual_end": actual_time})
+            _bump_version()
             return _schedule[i]
     return None
 
@@ -89,6 +105,7 @@ def clear_actual_times(act_name: str) -> Optional[Act]:
                 "actual_start": None,
                 "actual_end": None,
             })
+            _bump_version()
             return _schedule[i]
     return None
 
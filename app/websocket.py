@@ -1,50 +1,77 @@
-import json
-from typing import Callable, Optional
+import asyncio
 
 from fastapi import WebSocket
 
+BRIGHTNESS_MESSAGE = '{"type": "brightness", "value": %d}'
+
 
 class ConnectionManager:
     """Manages WebSocket connections for real-time sync between operators."""
 
     def __init__(self):
-        self.active_connections: dict[WebSocket, bool] = {}  # websocket -> is_editor
+        # Kept as two groups so each broadcast picks its message once per group
+        self.viewers: set[WebSocket] = set()
+        self.editors: set[WebSocket] = set()
+        # websocket -> schedule version it was last sent
+        self.last_sent_version: dict[WebSocket, int] = {}
         self.current_brightness: int = 0
 
     async def connect(self, websocket: WebSocket, is_editor: bool = False):
         """Accept a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections[websocket] = is_editor
+        if is_editor:
+            self.editors.add(websocket)
+        else:
+            self.viewers.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        self.active_connections.pop(websocket, None)
-
-    async def _send_to_all(self, get_message: Callable[[WebSocket, bool], Optional[str]]):
-        """Send messages to all clients, cleaning up disconnected ones."""
-        disconnected = []
-        for conn, is_editor in self.active_connections.items():
-            message = get_message(conn, is_editor)
-            if message:
-                try:
-                    await conn.send_text(message)
-                except Exception:
-                    disconnected.append(conn)
-        for conn in disconnected:
-            self.disconnect(conn)
+        self.viewers.discard(websocket)
+        self.editors.discard(websocket)
+        self.last_sent_version.pop(websocket, None)
+
+    async def _send(self, messages: list[tuple[WebSocket, str]]):
+        """Send (client, message) pairs concurrently, cleaning up disconnected clients.
+
+        Takes a list snapshot because the sets can change while sends are awaited.
+        """
+        results = await asyncio.gather(
+            *(conn.send_text(message) for conn, message in messages),
+            return_exceptions=True,
+        )
+        for (conn, _), result in zip(messages, results):
+            if isinstance(result, Exception):
+                self.disconnect(conn)
 
     async def broadcast(self, message: str):
         """Broadcast a message to all connected clients."""
-        await self._send_to_all(lambda c, e: message)
+        await self._send([(conn, message) for conn in [*self.viewers, *self.editors]])
+
+    def _is_stale(self, websocket: WebSocket, version: int) -> bool:
+        return self.last_sent_version.get(websocket, -1) < version
+
+    def needs_schedule(self, version: int) -> bool:
+        """Returns True if any client has not been sent this schedule version yet."""
+        return any(self._is_stale(conn, version) for conn in [*self.viewers, *self.editors])
+
+    async def broadcast_schedule(self, version: int, viewer_html: str, editor_html: str):
+        """Broadcast schedule HTML, sending appropriate version to each client.
 
-    async def broadcast_schedule(self, viewer_html: str, editor_html: str):
-        """Broadcast schedule HTML, sending appropriate version to each client."""
-        await self._send_to_all(lambda c, is_editor: editor_html if is_editor else viewer_html)
+        Clients that were already sent this schedule version are skipped.
+        """
+        messages = [
+            *((conn, viewer_html) for conn in self.viewers if self._is_stale(conn, version)),
+            *((conn, editor_html) for conn in self.editors if self._is_stale(conn, version)),
+        ]
+        for conn, _ in messages:
+            self.last_sent_version[conn] = version
+        await self._send(messages)
 
     async def broadcast_brightness(self, value: int):
         """Broadcast brightness value to all connected clients."""
         self.current_brightness = value
-        await self.broadcast(json.dumps({"type": "brightness", "value": value}))
+        # value is an int, so the JSON can be formatted directly without json.dumps
+        await self.broadcast(BRIGHTNESS_MESSAGE % value)
 
 
 # Global connection manager instance
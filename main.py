@@ -26,6 +26,9 @@ artnet_listener: Optional["ArtNetListener"] = None
 _polling_task: Optional[asyncio.Task] = None
 POLL_INTERVAL_SECONDS = 30
 
+# Background Google Sheets writer (only when USE_GOOGLE_SHEETS is enabled)
+_writer_task: Optional[asyncio.Task] = None
+
 
 async def poll_schedule():
     """Periodically fetch schedule from Google Sheets and broadcast updates."""
@@ -45,7 +48,7 @@ async def on_brightness_change(value: int) -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
-    global artnet_listener, _polling_task
+    global artnet_listener, _polling_task, _writer_task
 
     if settings.ARTNET_ENABLED:
         from app.artnet import ArtNetListener
@@ -61,6 +64,12 @@ async def lifespan(app: FastAPI):
     # Start background polling for schedule updates
     _polling_task = asyncio.create_task(poll_schedule())
 
+    # Write recorded times to Google Sheets in the background so requests
+    # don't wait on the API
+    if settings.USE_GOOGLE_SHEETS:
+        # If a write is given up on, re-broadcast so clients drop the lost time
+        _writer_task = asyncio.create_task(store.write_loop(on_write_failed=broadcast_schedule_update))
+
     yield
 
     # Shutdown
@@ -71,6 +80,14 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    # Cancelling the writer flushes any writes still queued
+    if _writer_task:
+        _writer_task.cancel()
+        try:
+            await _writer_task
+        except asyncio.CancelledError:
+            pass
+
     if artnet_listener:
         artnet_listener.stop()
 
@@ -187,11 +204,16 @@ async def broadcast_schedule_update():
     """Broadcast the updated schedule to all connected clients."""
     acts = store.get_schedule()
 
+    # Skip rendering when every client already has this version of the schedule
+    version = store.get_schedule_version()
+    if not manager.needs_schedule(version):
+        return
+
     # Build HTML for viewers (no buttons) and editors (with buttons)
     viewer_html = build_schedule_html(acts, view_only=True)
     editor_html = build_schedule_html(acts, view_only=False)
 
-    await manager.broadcast_schedule(viewer_html, editor_html)
+    await manager.broadcast_schedule(version, viewer_html, editor_html)
 
 
 @app.websocket("/ws")
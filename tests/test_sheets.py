@@ -0,0 +1,319 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from datetime import time
+from app import sheets
+
+HEADER = ["", "artist name", "", "scheduled start", "scheduled end", "actual time on", "actual time off"]
+
+
+class FakeWorksheet:
+    """In-memory stand-in for a gspread Worksheet that counts API calls."""
+
+    def __init__(self, rows):
+        self.rows = [list(r) for r in rows]
+        self.reads = 0
+        self.batches = []
+        self.value_input_options = []
+
+    def get(self, range_name):
+        # Mimic the API: rows from row 6, columns B-G, trailing blanks dropped
+        assert range_name == "B6:G"
+        self.reads += 1
+        rows = []
+        for r in self.rows[5:]:
+            cells = list(r[1:7])
+            while cells and cells[-1] == "":
+                cells.pop()
+            rows.append(cells)
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def batch_update(self, data, value_input_option=None):
+        self.batches.append(data)
+        self.value_input_options.append(value_input_option)
+        for entry in data:
+            start = entry["range"].split(":")[0]
+            col = ord(start[0]) - ord("A") + 1
+            row = int(start[1:])
+            while len(self.rows) < row:
+                self.rows.append([])
+            cells = self.rows[row - 1]
+            for offset, value in enumerate(entry["values"][0]):
+                cells.extend([""] * (col + offset - len(cells)))
+                cells[col + offset - 1] = value
+
+
+@pytest.fixture
+def fake_sheet(monkeypatch):
+    rows = [[""] * 7 for _ in range(4)] + [HEADER] + [
+        ["", "Sunrise Collective", "", "11:30", "12:00", "", ""],
+        ["", "Desert Echoes", "", "12:00", "13:45", "", ""],
+        ["", "", "", "", "", "", ""],
+        ["", "No Times", "", "", "", "", ""],
+    ]
+    sheet = FakeWorksheet(rows)
+    monkeypatch.setattr(sheets, "_sheet", sheet)
+    monkeypatch.setattr(sheets, "_cache", None)
+    monkeypatch.setattr(sheets, "_pending_writes", {})
+    monkeypatch.setattr(sheets.settings, "SHEETS_CACHE_TTL", 60.0)
+    return sheet
+
+
+# --- imports ---
+
+def test_import_does_not_load_google_libraries():
+    # Run in a fresh interpreter; this process may already have them loaded
+    code = (
+        "import sys, app.sheets; "
+        "print([m for m in ('gspread', 'google.oauth2') if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+# --- _parse_time ---
+
+def test_parse_time_hh_mm():
+    assert sheets._parse_time("14:30") == time(14, 30)
+
+
+def test_parse_time_single_digit_hour():
+    assert sheets._parse_time(" 9:05 ") == time(9, 5)
+
+
+def test_parse_time_ignores_seconds():
+    assert sheets._parse_time("14:30:59") == time(14, 30)
+
+
+def test_parse_time_reuses_parsed_value():
+    assert sheets._parse_time("17:45") is sheets._parse_time("17:45")
+
+
+def test_parse_time_invalid_returns_none():
+    for value in ["", "   ", "TBD", "14", ":30", "14:", "25:00", "14:xx"]:
+        assert sheets._parse_time(value) is None
+
+
+# --- _format_time ---
+
+def test_format_time_zero_pads():
+    assert sheets._format_time(time(9, 5, 30)) == "09:05"
+
+
+def test_format_time_none():
+    assert sheets._format_time(None) == ""
+
+
+# --- get_schedule ---
+
+def test_get_schedule_skips_rows_without_times(fake_sheet):
+    acts = sheets.get_schedule()
+    assert [a.act_name for a in acts] == ["Sunrise Collective", "Desert Echoes"]
+    assert acts[0].scheduled_start == time(11, 30)
+    assert acts[1].scheduled_end == time(13, 45)
+
+
+def test_get_schedule_reads_actual_times_from_ragged_rows(fake_sheet):
+    fake_sheet.rows[5][5] = "11:40"
+    fake_sheet.rows[6][5:7] = ["12:05", "13:55"]
+    sunrise, desert = sheets.get_schedule()
+    assert sunrise.actual_start == time(11, 40)
+    assert sunrise.actual_end is None
+    assert desert.actual_start == time(12, 5)
+    assert desert.actual_end == time(13, 55)
+
+
+def test_repeated_reads_within_ttl_hit_cache(fake_sheet):
+    sheets.get_schedule()
+    sheets.get_schedule()
+    sheets.get_act("Desert Echoes")
+    assert fake_sheet.reads == 1
+
+
+def test_expired_cache_rereads_sheet(fake_sheet, monkeypatch):
+    monkeypatch.setattr(sheets.settings, "SHEETS_CACHE_TTL", 0.0)
+    sheets.get_schedule()
+    sheets.get_schedule()
+    assert fake_sheet.reads == 2
+
+
+def test_schedule_version_unchanged_by_identical_reread(fake_sheet, monkeypatch):
+    sheets.update_actual_start("Sunrise Collective", time(11, 35))
+    sheets.clear_actual_times("Sunrise Collective")
+    version = sheets.get_schedule_version()
+    monkeypatch.setattr(sheets.settings, "SHEETS_CACHE_TTL", 0.0)
+    sheets.get_schedule()
+    assert sheets.get_schedule_version() == version
+
+
+def test_schedule_version_bumped_by_external_edit(fake_sheet, monkeypatch):
+    sheets.get_schedule()
+    version = sheets.get_schedule_version()
+    fake_sheet.rows[5][5] = "11:40"
+    monkeypatch.setattr(sheets.settings, "SHEETS_CACHE_TTL", 0.0)
+    sheets.get_schedule()
+    assert sheets.get_schedule_version() > version
+
+
+# --- get_act ---
+
+def test_get_act_by_name(fake_sheet):
+    act = sheets.get_act("Desert Echoes")
+    assert act.scheduled_start == time(12, 0)
+
+
+def test_get_act_unknown_or_incomplete_row_returns_none(fake_sheet):
+    assert sheets.get_act("Unknown Act") is None
+    assert sheets.get_act("No Times") is None
+
+
+# --- mutators ---
+
+def test_update_actual_start_writes_sheet_and_cache(fake_sheet):
+    act = sheets.update_actual_start("Sunrise Collective", time(11, 35))
+    assert act.actual_start == time(11, 35)
+    assert fake_sheet.rows[5][5] == "11:35"
+    assert fake_sheet.reads == 1
+
+
+def test_mutator_does_not_reread_sheet(fake_sheet, monkeypatch):
+    monkeypatch.setattr(sheets.settings, "SHEETS_CACHE_TTL", 0.0)
+    act = sheets.update_actual_start("Desert Echoes", time(12, 5))
+    assert act.actual_start == time(12, 5)
+    assert fake_sheet.reads == 1
+
+
+def test_update_actual_end_writes_sheet(fake_sheet):
+    act = sheets.update_actual_end("Desert Echoes", time(13, 50))
+    assert act.actual_end == time(13, 50)
+    assert fake_sheet.rows[6][6] == "13:50"
+
+
+def test_clear_actual_times_clears_both_columns(fake_sheet):
+    sheets.update_actual_start("Sunrise Collective", time(11, 35))
+    sheets.update_actual_end("Sunrise Collective", time(12, 5))
+    act = sheets.clear_actual_times("Sunrise Collective")
+    assert act.actual_start is None
+    assert act.actual_end is None
+    assert fake_sheet.rows[5][5:7] == ["", ""]
+
+
+def test_clear_actual_times_is_one_batch_update(fake_sheet):
+    sheets.clear_actual_times("Desert Echoes")
+    assert fake_sheet.batches == [[{"range": "F7:G7", "values": [["", ""]]}]]
+    assert fake_sheet.value_input_options == ["USER_ENTERED"]
+
+
+def test_update_unknown_act_returns_none(fake_sheet):
+    assert sheets.update_actual_start("Unknown Act", time(12, 0)) is None
+    assert fake_sheet.batches == []
+
+
+# --- write_loop ---
+
+def test_write_loop_returns_before_write_and_batches(fake_sheet):
+    async def scenario():
+        task = asyncio.create_task(sheets.write_loop())
+        await asyncio.sleep(0)
+        act = sheets.update_actual_end("Sunrise Collective", time(12, 2))
+        sheets.update_actual_start("Desert Echoes", time(12, 4))
+        # Served from the cache before anything has reached the sheet
+        assert act.actual_end == time(12, 2)
+        assert fake_sheet.batches == []
+        await asyncio.sleep(sheets.WRITE_BATCH_SECONDS * 3)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert len(fake_sheet.batches) == 1
+    assert fake_sheet.value_input_options == ["USER_ENTERED"]
+    assert fake_sheet.rows[5][6] == "12:02"
+    assert fake_sheet.rows[6][5] == "12:04"
+    assert sheets._pending_writes == {}
+
+
+def test_write_loop_pending_writes_survive_reread(fake_sheet, monkeypatch):
+    async def scenario():
+        task = asyncio.create_task(sheets.write_loop())
+        await asyncio.sleep(0)
+        sheets.update_actual_start("Sunrise Collective", time(11, 31))
+        monkeypatch.setattr(sheets.settings, "SHEETS_CACHE_TTL", 0.0)
+        act = sheets.get_act("Sunrise Collective")
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return act
+
+    act = asyncio.run(scenario())
+    assert act.actual_start == time(11, 31)
+    assert fake_sheet.rows[5][5] == "11:31"
+
+
+def test_write_loop_retries_failed_write(fake_sheet, monkeypatch):
+    monkeypatch.setattr(sheets, "WRITE_RETRY_SECONDS", 0.2)
+    failures = [RuntimeError("429 rate limited")]
+    real_batch_update = fake_sheet.batch_update
+
+    def flaky_batch_update(data, **kwargs):
+        if failures:
+            raise failures.pop()
+        real_batch_update(data, **kwargs)
+
+    monkeypatch.setattr(fake_sheet, "batch_update", flaky_batch_update)
+
+    async def scenario():
+        task = asyncio.create_task(sheets.write_loop())
+        await asyncio.sleep(0)
+        sheets.update_actual_start("Sunrise Collective", time(11, 33))
+        await asyncio.sleep(sheets.WRITE_BATCH_SECONDS + 0.05)
+        # First attempt failed: the value is still pending rather than dropped
+        assert not failures
+        assert fake_sheet.rows[5][5] == ""
+        assert sheets._pending_writes == {(6, 6): "11:33"}
+        await asyncio.sleep(0.3)
+        # The retry landed before shutdown, so there was nothing left to flush
+        assert fake_sheet.rows[5][5] == "11:33"
+        assert sheets._pending_writes == {}
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+
+
+def test_write_loop_gives_up_and_reports_revert(fake_sheet, monkeypatch):
+    monkeypatch.setattr(sheets, "WRITE_RETRY_SECONDS", 0.01)
+    monkeypatch.setattr(sheets, "WRITE_MAX_ATTEMPTS", 2)
+
+    def failing_batch_update(data, **kwargs):
+        raise RuntimeError("read timeout")
+
+    monkeypatch.setattr(fake_sheet, "batch_update", failing_batch_update)
+    failed = []
+
+    async def on_write_failed():
+        failed.append(sheets.get_schedule_version())
+
+    async def scenario():
+        task = asyncio.create_task(sheets.write_loop(on_write_failed=on_write_failed))
+        await asyncio.sleep(0)
+        sheets.update_actual_start("Sunrise Collective", time(11, 33))
+        version = sheets.get_schedule_version()
+        await asyncio.sleep(sheets.WRITE_BATCH_SECONDS + 0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return version
+
+    version = asyncio.run(scenario())
+    assert failed and failed[0] > version
+    assert sheets._pending_writes == {}
+    assert sheets.get_act("Sunrise Collective").actual_start is None
@@ -1,6 +1,6 @@
 from datetime import time
 from app.models import Act
-from app.slip import calculate_slip, format_duration, format_variance
+from app.slip import calculate_slip, format_duration, format_variance, time_to_seconds
 
 
 def make_act(sched_start, sched_end, actual_start=None, actual_end=None):
@@ -13,6 +13,16 @@ def make_act(sched_start, sched_end, actual_start=None, actual_end=None):
     )
 
 
+# --- time_to_seconds ---
+
+def test_time_to_seconds_midnight():
+    assert time_to_seconds(time(0, 0)) == 0
+
+
+def test_time_to_seconds_includes_seconds():
+    assert time_to_seconds(time(13, 5, 30)) == 13 * 3600 + 5 * 60 + 30
+
+
 # --- calculate_slip ---
 
 def test_slip_empty_list():
@@ -58,6 +68,24 @@ def test_slip_in_progress_late_start():
     assert calculate_slip(acts) == 10 * 60
 
 
+def test_slip_uses_latest_recorded_act():
+    # An earlier late finish is superseded by a later on-time act
+    acts = [
+        make_act(time(12, 0), time(13, 0), actual_start=time(12, 0), actual_end=time(13, 20)),
+        make_act(time(13, 30), time(14, 0), actual_start=time(13, 30), actual_end=time(14, 0)),
+        make_act(time(14, 30), time(15, 0)),
+    ]
+    assert calculate_slip(acts) == 0
+
+
+def test_slip_ignores_pending_acts_after_in_progress():
+    acts = [
+        make_act(time(12, 0), time(13, 0), actual_start=time(12, 5)),
+        make_act(time(13, 30), time(14, 0)),
+    ]
+    assert calculate_slip(acts) == 5 * 60
+
+
 # --- format_duration ---
 
 def test_format_duration_zero():
@@ -89,6 +117,11 @@ def test_format_duration_negative():
     assert format_duration(-60) == "-1m"
 
 
+def test_format_duration_negative_hours_and_seconds():
+    assert format_duration(-3660) == "-1h 1m"
+    assert format_duration(-45) == "-45s"
+
+
 # --- format_variance ---
 
 def test_format_variance_none():
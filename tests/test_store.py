@@ -104,3 +104,17 @@ def test_clear_actual_times_persists():
     acts = store.get_schedule()
     act = next(a for a in acts if a.act_name == FIRST_ACT)
     assert act.actual_start is None
+
+
+# --- get_schedule_version ---
+
+def test_update_bumps_schedule_version():
+    before = store.get_schedule_version()
+    store.update_actual_start(FIRST_ACT, time(11, 35))
+    assert store.get_schedule_version() > before
+
+
+def test_unknown_act_keeps_schedule_version():
+    before = store.get_schedule_version()
+    store.update_actual_start("Unknown Act", time(11, 35))
+    assert store.get_schedule_version() == before
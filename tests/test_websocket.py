@@ -0,0 +1,104 @@
+import asyncio
+import json
+from app.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self, fail=False, delay=0.0):
+        self.fail = fail
+        self.delay = delay
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.sent.append(message)
+
+
+def _connect(manager, is_editor=False, fail=False, delay=0.0):
+    ws = FakeWebSocket(fail=fail, delay=delay)
+    asyncio.run(manager.connect(ws, is_editor=is_editor))
+    return ws
+
+
+# --- broadcast ---
+
+def test_broadcast_reaches_viewers_and_editors():
+    manager = ConnectionManager()
+    viewer = _connect(manager)
+    editor = _connect(manager, is_editor=True)
+    asyncio.run(manager.broadcast("hello"))
+    assert viewer.sent == ["hello"]
+    assert editor.sent == ["hello"]
+
+
+def test_broadcast_schedule_sends_html_per_role():
+    manager = ConnectionManager()
+    viewer = _connect(manager)
+    editor = _connect(manager, is_editor=True)
+    asyncio.run(manager.broadcast_schedule(1, "<viewer>", "<editor>"))
+    assert viewer.sent == ["<viewer>"]
+    assert editor.sent == ["<editor>"]
+
+
+def test_broadcast_schedule_skips_clients_with_same_version():
+    manager = ConnectionManager()
+    viewer = _connect(manager)
+    asyncio.run(manager.broadcast_schedule(1, "<v1>", "<e1>"))
+    assert not manager.needs_schedule(1)
+
+    late_editor = _connect(manager, is_editor=True)
+    assert manager.needs_schedule(1)
+    asyncio.run(manager.broadcast_schedule(1, "<v1>", "<e1>"))
+    assert viewer.sent == ["<v1>"]
+    assert late_editor.sent == ["<e1>"]
+
+    asyncio.run(manager.broadcast_schedule(2, "<v2>", "<e2>"))
+    assert viewer.sent == ["<v1>", "<v2>"]
+    assert late_editor.sent == ["<e1>", "<e2>"]
+
+
+def test_failed_send_disconnects_client():
+    manager = ConnectionManager()
+    ok = _connect(manager)
+    broken = _connect(manager, is_editor=True, fail=True)
+    asyncio.run(manager.broadcast("hello"))
+    assert ok.sent == ["hello"]
+    assert broken not in manager.editors
+    assert ok in manager.viewers
+
+
+def test_broadcast_sends_concurrently():
+    manager = ConnectionManager()
+    clients = [_connect(manager, is_editor=i % 2 == 0, delay=0.05) for i in range(10)]
+
+    async def timed_broadcast():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await manager.broadcast_schedule(1, "<viewer>", "<editor>")
+        return loop.time() - started
+
+    # Ten 50ms sends in sequence would take 500ms
+    assert asyncio.run(timed_broadcast()) < 0.25
+    assert all(len(c.sent) == 1 for c in clients)
+
+
+def test_disconnect_removes_client():
+    manager = ConnectionManager()
+    viewer = _connect(manager)
+    manager.disconnect(viewer)
+    assert viewer not in manager.viewers
+
+
+# --- broadcast_brightness ---
+
+def test_broadcast_brightness_sends_json():
+    manager = ConnectionManager()
+    viewer = _connect(manager)
+    asyncio.run(manager.broadcast_brightness(40000))
+    assert json.loads(viewer.sent[0]) == {"type": "brightness", "value": 40000}
+    assert manager.current_brightness == 40000